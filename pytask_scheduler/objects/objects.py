@@ -1,7 +1,11 @@
 import polars as pl
+import pythoncom
 import win32com.client
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Literal
-from datetime import datetime, timedelta
+from datetime import datetime, time
 from pytask_scheduler import (
     TaskActionTypes,
     TaskTriggerTypes,
@@ -10,33 +14,97 @@ from pytask_scheduler import (
     TaskValueDefinitions
 )
 
-class TasksDataFrame(pl.DataFrame):
+# number of threads used for extracting the registered tasks info.
+_MAX_INFO_WORKERS = 16
+
+# column types of the registered tasks info, see `RegisteredTask.info`.
+_TASKS_SCHEMA = {
+    "name":pl.Utf8,
+    "enabled":pl.Boolean,
+    "task_state":pl.Int64,
+    "next_run_time":pl.Datetime,
+    "last_run_time":pl.Datetime,
+    "last_task_result":pl.Int64,
+    "number_of_missed_runs":pl.Int64,
+    "task_path":pl.Utf8,
+    "author":pl.Utf8,
+    "registration_date":pl.Utf8,
+    "task_description":pl.Utf8,
+    "task_source":pl.Utf8,
+    "AllowDemandStart":pl.Boolean,
+    "StartWhenAvailable":pl.Boolean,
+    "Enabled":pl.Boolean,
+    "Hidden":pl.Boolean,
+    "RestartInterval":pl.Utf8,
+    "RestartCount":pl.Int64,
+    "ExecutionTimeLimit":pl.Utf8,
+    "MultipleInstances":pl.Int64,
+    "execution_path":pl.Utf8
+}
+
+# action type constant, bound once for the task creation and info hot paths.
+_TASK_ACTION_EXEC = TaskActionTypes.TASK_ACTION_EXEC
+
+# integer keyed lookups for mapping the raw com values to their definitions, unmapped values
+# such as failure hresults (negative, the com value is a signed long) keep their raw code.
+_TASK_STATE_DEFINITION = {
+    int(k):v for k,v in TaskValueDefinitions.TASK_STATE_DEFINITION.items()
+}
+_TASK_RESULT_DEFINITION = {
+    int(k):v for k,v in TaskValueDefinitions.TASK_RESULT_DEFINITION.items()
+}
+
+# statistics computed over the tasks data frame, see `TasksDataFrame.stats`.
+_TASKS_STATS_EXPRESSIONS = {
+    "task_total":pl.len().cast(pl.Int64),
+    "missed_runs_total":pl.col("number_of_missed_runs").sum(),
+    **{
+        f"{definition.lower()}_state_total":(pl.col("task_state")==state).sum().cast(pl.Int64)
+        for state, definition in TaskValueDefinitions.TASK_STATE_DEFINITION.items()
+    }
+}
+
+class TasksDataFrame:
     """Data frame for scheduled tasks."""
     def __init__(self, data: pl.DataFrame):
-        super().__init__(data)
         self.df = data
 
-    def preprocess(self):
-        """Preprocess the tasks data frame."""
-        df = (self.df
+    def __repr__(self) -> str:
+        return repr(self.df)
+
+    def _repr_html_(self) -> str:
+        return self.df._repr_html_()
+
+    @staticmethod
+    def _preprocess_lazy(lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Builds the preprocessing query for the tasks data frame."""
+        return (lf
             .with_columns(
                 pl.col("task_state")
-                .cast(str)
-                .replace(TaskValueDefinitions.TASK_STATE_DEFINITION)
+                .replace_strict(
+                    _TASK_STATE_DEFINITION,
+                    default=pl.col("task_state").cast(pl.Utf8),
+                    return_dtype=pl.Utf8
+                )
+                .cast(pl.Categorical)
                 .alias("task_state_definition"),
                 pl.col("last_task_result")
-                .cast(str)
-                .replace(TaskValueDefinitions.TASK_RESULT_DEFINITION)
+                .replace_strict(
+                    _TASK_RESULT_DEFINITION,
+                    default=pl.col("last_task_result").cast(pl.Utf8),
+                    return_dtype=pl.Utf8
+                )
+                .cast(pl.Categorical)
                 .alias("last_task_result_definition"),
+                # pywin32 attaches a tzinfo to com dates, and depending on the polars version
+                # and input orientation the column can keep that time zone. Cast to the naive
+                # Datetime that the today-window filters compare against.
                 pl.col("next_run_time").cast(pl.Datetime),
                 pl.col("last_run_time").cast(pl.Datetime),
-                pl.col("task_path").str.split("\\").alias("task_folder_name")
-            )
-            .with_columns(
-                pl.when(pl.col("task_folder_name").list.len() <= 2)
-                .then(pl.lit("\\"))
-                .otherwise(pl.col("task_folder_name").list.slice(1,2).list.first())
-                .name.keep()
+                pl.col("task_path")
+                .str.extract(r"^\\([^\\]+)\\", 1)
+                .fill_null("\\")
+                .alias("task_folder_name")
             )
             .select(
                 [
@@ -67,93 +135,110 @@ class TasksDataFrame(pl.DataFrame):
                 ]
             )
         )
+
+    @classmethod
+    def from_records(
+        cls,
+        records: list[dict],
+        schema: dict=_TASKS_SCHEMA,
+        filter_expr: pl.Expr|None=None
+    ):
+        """Build and preprocess the tasks data frame in a single lazy query.
+
+        Parameters:
+            records (`list[dict]`): Registered tasks info, one dict per task.
+            schema (`dict`): Column types of the registered tasks info.
+            filter_expr (`pl.Expr`): Optional predicate applied before collecting.
+
+        Returns:
+            TasksDataFrame object.
+        """
+        lf = cls._preprocess_lazy(pl.LazyFrame(records, schema=schema))
+        if filter_expr is not None:
+            lf = lf.filter(filter_expr)
+        return cls(lf.collect())
+
+    def preprocess(self):
+        """Preprocess the tasks data frame."""
+        df = self._preprocess_lazy(self.df.lazy()).collect()
         return TasksDataFrame(df)
 
     def stats(self) -> pl.DataFrame:
         """Get statistics on all the tasks."""
-        stats_schema = {
-            "task_total":self.total_number_of_tasks(),
-            "missed_runs_total":self.total_number_of_missed_runs(),
-            "unknown_state_total":self.total_number_of_tasks_by_state(0),
-            "disabled_state_total":self.total_number_of_tasks_by_state(1),
-            "queued_state_total":self.total_number_of_tasks_by_state(2),
-            "ready_state_total":self.total_number_of_tasks_by_state(3),
-            "running_state_total":self.total_number_of_tasks_by_state(4)
-        }
+        return (self.df
+            .lazy()
+            .select([expr.alias(name) for name, expr in _TASKS_STATS_EXPRESSIONS.items()])
+            .collect()
+        )
 
-        return pl.DataFrame(stats_schema)
+    def __stat(self, name: str) -> int:
+        """Computes a single statistic from `stats` as a scalar."""
+        return (self.df
+            .lazy()
+            .select(_TASKS_STATS_EXPRESSIONS[name])
+            .collect()
+            .item()
+        )
 
     def total_number_of_tasks(self):
         """Total number of scheduled tasks, this will include disabled tasks."""
-        return self.df.shape[0]
+        return self.__stat("task_total")
 
     def total_number_of_missed_runs(self):
         """Total number of missed runs."""
-        return self.df["number_of_missed_runs"].sum()
+        return self.__stat("missed_runs_total")
 
     def total_number_of_tasks_by_state(self, task_state: Literal[0,1,2,3,4]):
         """Total number of scheduled tasks filtered by the task state."""
-        return self.df.filter(pl.col("task_state")==task_state).shape[0]
+        definition = TaskValueDefinitions.TASK_STATE_DEFINITION[task_state]
+        return self.__stat(f"{definition.lower()}_state_total")
     
+    @staticmethod
+    def completed_today_filter() -> pl.Expr:
+        """Predicate for the scheduled tasks that were completed today."""
+        current_datetime = datetime.now()
+        todays_date = current_datetime.date()
+        return pl.col("last_run_time").is_between(todays_date,current_datetime)
+
+    @staticmethod
+    def due_today_filter() -> pl.Expr:
+        """Predicate for the tasks that are due to execute today."""
+        current_dt = datetime.now()
+        todays_date = current_dt.date()
+
+        lower_date = current_dt
+        upper_date = datetime.combine(todays_date, time.max)
+
+        return pl.col("next_run_time").is_between(lower_date, upper_date)
+
     def get_tasks_completed_today(self):
         """Get the scheduled tasks that were completed today."""
-        todays_date = datetime.today().date()
-        current_datetime = datetime.now()
         df = (self.df
-            .filter(
-                pl.col("last_run_time")
-                .cast(pl.Datetime)
-                .is_between(todays_date,current_datetime)
-            )
+            .filter(self.completed_today_filter())
             .sort("last_run_time", descending=True)
         )
         return TasksDataFrame(df)
     
     def get_tasks_due_today(self):
         """Get the tasks that are due to execute today."""
-        MAX_HOUR = 23
-        MAX_MIN = 59
-        MAX_SEC = 59
-        MAX_MSEC = 999999
-
-        current_dt = datetime.now()
-
-        lower_date = current_dt
-
-        thour = lower_date.hour
-        tmin = lower_date.minute
-        tsec = lower_date.second
-        tmsec = lower_date.microsecond
-
-        upper_date = (current_dt.date() +
-            timedelta(
-                hours=MAX_HOUR-thour,
-                minutes=MAX_MIN-tmin,
-                seconds=MAX_SEC-tsec,
-                microseconds=MAX_MSEC-tmsec
-            )
-        )
-
         df = (self.df
-            .filter(
-                pl.col("next_run_time")
-                .cast(pl.Datetime)
-                .is_between(
-                    lower_date,
-                    upper_date
-                )
-            )
+            .filter(self.due_today_filter())
             .sort("next_run_time")
         )
 
         return TasksDataFrame(df)
 
-class HistoryDataFrame(pl.DataFrame):
+class HistoryDataFrame:
     """Data frame for the task history."""
     def __init__(self, data: pl.DataFrame):
-        super().__init__(data)
         self.df = data
 
+    def __repr__(self) -> str:
+        return repr(self.df)
+
+    def _repr_html_(self) -> str:
+        return self.df._repr_html_()
+
     def preprocess(self):
         """Preprocessing for the historical data frame."""
         df = (self.df
@@ -167,11 +252,12 @@ class HistoryDataFrame(pl.DataFrame):
             }) 
             .with_columns(
                 pl.col("Event Created")
-                .str.strptime(pl.Datetime,"%Y-%m-%d %H:%M:%S%.6f")
+                .str.to_datetime(format="%Y-%m-%d %H:%M:%S%.6f", strict=False, exact=True, cache=True)
                 .name.keep(),
                 pl.col("Event Level").cast(pl.Int64),
                 pl.col("Event ID").cast(pl.Int64),
-                pl.col("Task Name").str.split("\\").list.last().name.keep()
+                pl.col("Task Name").str.split("\\").list.last().name.keep(),
+                pl.col("Event Log Description").cast(pl.Categorical)
             )
         )
         return HistoryDataFrame(df)
@@ -179,10 +265,21 @@ class HistoryDataFrame(pl.DataFrame):
     def get_todays_history(self):
         """Filter the history data frame based on today's date."""
         df = self.df.filter(
-            pl.col("Event Created").cast(pl.Date)==datetime.now().date()
+            pl.col("Event Created").dt.date()==datetime.now().date()
         ).sort("Event Created", descending=True)
         return HistoryDataFrame(df)
 
+    def summary(self) -> pl.DataFrame:
+        """Get the count of information, error and warning events in a single pass."""
+        return (self.df
+            .lazy()
+            .select([
+                (pl.col("Event Log Description")==description).sum().alias(description.lower())
+                for description in ("INFORMATION","ERROR","WARNING")
+            ])
+            .collect()
+        )
+
     def __event_count_by_criteria(self, filter_col: str, filter_criteria: str) -> int:
         """Counts the number of events based on the filter column and criteria."""
         return self.df.filter(pl.col(filter_col)==filter_criteria).shape[0]
@@ -213,17 +310,30 @@ class TaskScheduler:
         self.client.Connect()
         self.root_folder = self.client.GetFolder("\\")
         self.folders = [f.Name for f in self.root_folder.GetFolders(0)]
+        self._folder_path_cache: dict[str, str]|None = None
 
-    def __find_folder(self, folder, folder_name: str) -> str:
+    def __walk_folders(self):
+        """Iterate over every folder object in task scheduler and cache their paths by name.
+
+        Folders are visited depth first in the order task scheduler lists them, so the first \
+            folder cached under a duplicated name is the same one a recursive search finds.
+        """
+        self._folder_path_cache = {}
+        folders = [self.root_folder]
+        while folders:
+            folder = folders.pop()
+            if folder is not self.root_folder:
+                self._folder_path_cache.setdefault(folder.Name, folder.Path)
+            yield folder
+            # push the subfolders in reverse so they are popped in their listed order.
+            folders.extend(reversed(list(folder.GetFolders(0))))
+
+    def __find_folder(self, folder_name: str, refresh: bool=False) -> str|None:
         """Find and return the folder path from task scheduler."""
-        folders = folder.GetFolders(0)
-        for subfolder in folders:
-            if subfolder.Name == folder_name:
-                return subfolder.Path
-            fpath = self.__find_folder(subfolder, folder_name)
-            if fpath:
-                return fpath
-        return None
+        if refresh or self._folder_path_cache is None or folder_name not in self._folder_path_cache:
+            for _ in self.__walk_folders():
+                pass
+        return self._folder_path_cache.get(folder_name)
 
     def get_folder(self, folder_name: str|None=None):
         """Get the folder object.
@@ -237,40 +347,68 @@ class TaskScheduler:
 
         if folder_name is None:
             return TaskFolder(self.root_folder)
-        else:
-            folder_path = self.__find_folder(self.root_folder, folder_name)
-            if folder_path:
+
+        folder_path = self.__find_folder(folder_name)
+        if folder_path:
+            try:
                 folder = self.client.GetFolder(folder_path)
-                return TaskFolder(folder)
-            else:
-                raise ValueError(f"Could not find {folder_name}")
-
-    def __list_tasks_info_in_folder(self, folder, folder_name: str, tasks_info_list: list):
-        """Recursively list all tasks within folders."""
-
-        # extract and append all the tasks info in the list.
-        tasks = folder.tasks
-        for t in tasks:
-            tasks_info_list.append(folder.get_task(t).info())
-
-        # walk through all subfolders and get the tasks info.
-        subfolders = folder.subfolders
-        for sf in subfolders:
-            subfolder = self.get_folder(sf)
-            self.__list_tasks_info_in_folder(
-                subfolder,
-                folder_name + "\\" + sf,
-                tasks_info_list
-            )
+            except pythoncom.com_error:
+                # the cached path is stale, the folder was moved or deleted since the last walk.
+                folder_path = self.__find_folder(folder_name, refresh=True)
+                if folder_path is None:
+                    raise ValueError(f"Could not find {folder_name}")
+                folder = self.client.GetFolder(folder_path)
+            return TaskFolder(folder)
+        else:
+            raise ValueError(f"Could not find {folder_name}")
+
+    @staticmethod
+    def __registered_tasks_info(task_paths: list[str]) -> list[dict]:
+        """Extracts the tasks info through a task scheduler connection owned by this thread."""
+        pythoncom.CoInitialize()
+        client = root_folder = None
+        try:
+            # `Dispatch` reuses the com wrappers generated by `EnsureDispatch` in `__init__`.
+            client = win32com.client.Dispatch("Schedule.Service")
+            client.Connect()
+            root_folder = client.GetFolder("\\")
+            return [RegisteredTask(root_folder.GetTask(p)).info() for p in task_paths]
+        finally:
+            # release the com objects before tearing down com on this thread.
+            client = root_folder = None
+            pythoncom.CoUninitialize()
+
+    def __list_tasks_info(self) -> list[dict]:
+        """Walk the folder tree and list the info of every task."""
+        # only the task paths cross threads, each worker resolves them on its own connection.
+        task_paths = [t.Path for folder in self.__walk_folders() for t in folder.GetTasks(0)]
+        batch_size = max(1, -(-len(task_paths) // _MAX_INFO_WORKERS))
+        batches = [task_paths[i:i+batch_size] for i in range(0, len(task_paths), batch_size)]
+
+        # extracting the task info is bound by the com calls, so run it on a thread pool.
+        with ThreadPoolExecutor(max_workers=_MAX_INFO_WORKERS) as executor:
+            tasks_info_list = [
+                info for batch in executor.map(self.__registered_tasks_info, batches)
+                for info in batch
+            ]
+        return tasks_info_list
+
+    def get_all_tasks(self, filter_expr: pl.Expr|None=None) -> TasksDataFrame:
+        """Method for extracting all the scheduled tasks.
+
+        Parameters:
+            filter_expr (`pl.Expr`): Optional predicate applied to the preprocessed tasks \
+                before the data frame is collected. Every task is still extracted from task \
+                scheduler, the filter only drops rows from the returned data frame. Time \
+                window predicates read the clock when they are built, for today's schedule \
+                prefer `get_tasks_due_today` or `get_tasks_completed_today` on the result, \
+                which also sort the tasks.
 
-    def get_all_tasks(self) -> pl.DataFrame:
-        """Method for extracting all the scheduled tasks."""
-        root_folder = self.get_folder()
-        tasks_info_list = []
-        self.__list_tasks_info_in_folder(root_folder, "\\", tasks_info_list)
-        df = pl.DataFrame(tasks_info_list)
-        df = TasksDataFrame(df).preprocess()
-        return df
+        Returns:
+            TasksDataFrame object.
+        """
+        tasks_info_list = self.__list_tasks_info()
+        return TasksDataFrame.from_records(tasks_info_list, filter_expr=filter_expr)
 
     def create_task(
         self,
@@ -339,17 +477,20 @@ class TaskScheduler:
         # create task def.
         new_taskdef = self.client.NewTask(0)
 
+        tt = TaskTrigger(new_taskdef)
+        ta = TaskAction(new_taskdef)
+
         # create new trigger.
         match trigger_type:
             case "daily":
-                new_taskdef = TaskTrigger(new_taskdef).create_daily_trigger(
+                new_taskdef = tt.create_daily_trigger(
                     start_date=start_date,
                     start_time=start_time,
                     days_interval=days_interval
                 )
 
             case "weekly":
-                new_taskdef = TaskTrigger(new_taskdef).create_weekly_trigger(
+                new_taskdef = tt.create_weekly_trigger(
                     start_date=start_date,
                     start_time=start_time,
                     weeks_interval=weeks_interval,
@@ -357,7 +498,7 @@ class TaskScheduler:
                 )
 
             case "monthly":
-                new_taskdef = TaskTrigger(new_taskdef).create_monthly_trigger(
+                new_taskdef = tt.create_monthly_trigger(
                     trigger_type="month",
                     start_date=start_date,
                     start_time=start_time,
@@ -368,7 +509,7 @@ class TaskScheduler:
                 )
 
             case "monthlydow":
-                new_taskdef = TaskTrigger(new_taskdef).create_monthly_trigger(
+                new_taskdef = tt.create_monthly_trigger(
                     trigger_type="dow",
                     start_date=start_date,
                     start_time=start_time,
@@ -379,7 +520,7 @@ class TaskScheduler:
                 )
 
             case "one-time":
-                new_taskdef = TaskTrigger(new_taskdef).create_one_time_trigger(
+                new_taskdef = tt.create_one_time_trigger(
                     start_date=start_date,
                     start_time=start_time
                 )
@@ -387,7 +528,7 @@ class TaskScheduler:
         # create a new task action
         match action_type:
             case "exec":
-                new_action = TaskAction(new_taskdef).create_execution_action(
+                new_action = ta.create_execution_action(
                     argument=action_arg,
                     filepath=action_file,
                     working_dir=action_working_dir
@@ -426,51 +567,68 @@ class RegisteredTask:
     """This object covers some of the api from the RegisteredTask scripting object.
         https://learn.microsoft.com/en-us/windows/win32/taskschd/registeredtask
     """
+    _EXEC_CMD_XPATH = "./{ns}Actions/{ns}Exec/{ns}Command".format(
+        ns="{http://schemas.microsoft.com/windows/2004/02/mit/task}"
+    )
+
+    _SETTINGS_ATTRIBUTES = (
+        "AllowDemandStart",
+        "StartWhenAvailable",
+        "Enabled",
+        "Hidden",
+        "RestartInterval",
+        "RestartCount",
+        "ExecutionTimeLimit",
+        "MultipleInstances"
+    )
+
     def __init__(self, rtask_obj):
         self.rtask = rtask_obj
-        self.xml = rtask_obj.Xml
         self.taskdef = self.rtask.Definition
         self.reg_info = self.taskdef.RegistrationInfo
         self.task_settings = self.taskdef.Settings
 
+    @cached_property
+    def xml(self) -> str:
+        """XML text of the registered task, read on first access."""
+        return self.rtask.Xml
+
     def info(self) -> dict:
         """Information on registered task."""
+        rt, ri, ts = self.rtask, self.reg_info, self.task_settings
         return {
-            "name":self.rtask.Name,
-            "enabled":self.rtask.Enabled,
-            "task_state":self.rtask.State,
-            "next_run_time":self.rtask.NextRunTime,
-            "last_run_time":self.rtask.LastRunTime,
-            "last_task_result":self.rtask.LastTaskResult,
-            "number_of_missed_runs":self.rtask.NumberOfMissedRuns,
-            "task_path":self.rtask.Path,
-            "author":self.reg_info.Author,
-            "registration_date":self.reg_info.Date,
-            "task_description":self.reg_info.Description,
-            "task_source":self.reg_info.Source,
-            "AllowDemandStart": self.task_settings.AllowDemandStart,
-            "StartWhenAvailable": self.task_settings.StartWhenAvailable,
-            "Enabled": self.task_settings.Enabled,
-            "Hidden": self.task_settings.Hidden,
-            "RestartInterval": self.task_settings.RestartInterval,
-            "RestartCount": self.task_settings.RestartCount,
-            "ExecutionTimeLimit": self.task_settings.ExecutionTimeLimit,
-            "MultipleInstances": self.task_settings.MultipleInstances,
+            "name":rt.Name,
+            "enabled":rt.Enabled,
+            "task_state":rt.State,
+            "next_run_time":rt.NextRunTime,
+            "last_run_time":rt.LastRunTime,
+            "last_task_result":rt.LastTaskResult,
+            "number_of_missed_runs":rt.NumberOfMissedRuns,
+            "task_path":rt.Path,
+            "author":ri.Author,
+            "registration_date":ri.Date,
+            "task_description":ri.Description,
+            "task_source":ri.Source,
+            **{attr:getattr(ts, attr) for attr in self._SETTINGS_ATTRIBUTES},
             "execution_path":self.__extract_action_execpath()
         }
 
-    def __extract_action_execpath(self):
-        """Gets the action file path from the tasks xml text."""
+    def __extract_action_execpath(self) -> str:
+        """Gets the action file path from the task's execution actions."""
         exepath = ""
-        import xml.etree.ElementTree as ET
-        root = ET.fromstring(self.xml)
-        for act in root.findall('{http://schemas.microsoft.com/windows/2004/02/mit/task}Actions'):
-            for exe in act.findall('{http://schemas.microsoft.com/windows/2004/02/mit/task}Exec'):
-                for command in exe.findall('{http://schemas.microsoft.com/windows/2004/02/mit/task}Command'):
-                    exepath = command.text
-
+        try:
+            for action in self.taskdef.Actions:
+                if action.Type == _TASK_ACTION_EXEC:
+                    exepath = win32com.client.CastTo(action, "IExecAction").Path
+        except pythoncom.com_error:
+            exepath = self.__extract_action_execpath_from_xml()
         return exepath
 
+    def __extract_action_execpath_from_xml(self) -> str:
+        """Gets the action file path from the tasks xml text."""
+        commands = ET.fromstring(self.xml).findall(self._EXEC_CMD_XPATH)
+        return commands[-1].text if commands else ""
+
     def update_registration_info(self, task_description: str):
         """Updates the registration info for a task.
 
@@ -512,7 +670,7 @@ class TaskAction:
             working_dir (`str`): Sets the directory that contains either the executable file \
             or the files that are used by the executable file.
         """
-        self.__set_action_type(TaskActionTypes.TASK_ACTION_EXEC)
+        self.__set_action_type(_TASK_ACTION_EXEC)
         self.action.Path = filepath
         self.action.Arguments = argument
         self.action.WorkingDirectory = working_dir
@@ -543,8 +701,16 @@ class TaskFolder:
 
     def __init__(self, folder_obj):
         self.folder = folder_obj
-        self.subfolders = [f.Name for f in self.folder.GetFolders(0)]
-        self.tasks = [t.Name for t in self.folder.GetTasks(0)]
+
+    @cached_property
+    def subfolders(self) -> list[str]:
+        """List of the subfolder names, enumerated on first access."""
+        return [f.Name for f in self.folder.GetFolders(0)]
+
+    @cached_property
+    def tasks(self) -> list[str]:
+        """List of the task names, enumerated on first access."""
+        return [t.Name for t in self.folder.GetTasks(0)]
 
     def info(self) -> dict:
         """Folder information stored in a hash table.
@@ -572,6 +738,7 @@ class TaskFolder:
             raise ValueError(f"{folder_name} already exists!")
         else:
             new_folder = self.folder.CreateFolder(folder_name)
+            self.__dict__.pop("subfolders", None)
             return TaskFolder(new_folder)
 
     def delete_folder(self, folder_name: str):
@@ -582,6 +749,7 @@ class TaskFolder:
         """
         if folder_name in self.subfolders:
             self.folder.DeleteFolder(folder_name)
+            self.__dict__.pop("subfolders", None)
         else:
             raise ValueError(f"{folder_name} does not exist!")
 
@@ -611,6 +779,7 @@ class TaskFolder:
             "", # no password
             TaskLogonTypes.TASK_LOGON_NONE
         )
+        self.__dict__.pop("tasks", None)
  
 class TaskSettings:
     """This object covers topics from the TaskSettings object.
@@ -0,0 +1,37 @@
+import sys
+import types
+
+# pywin32 and python-evtx only install on windows, stub them so the polars and
+# folder walking logic can be tested anywhere. tests patch the entry points they use.
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:
+    def _unavailable(*args, **kwargs):
+        raise OSError("pywin32 is not available on this platform.")
+
+    class com_error(Exception):
+        pass
+
+    sys.modules["pythoncom"] = types.SimpleNamespace(
+        com_error=com_error,
+        IID_IDispatch=None,
+        CoInitialize=_unavailable,
+        CoUninitialize=_unavailable,
+    )
+    win32com = types.ModuleType("win32com")
+    win32com.client = types.SimpleNamespace(
+        gencache=types.SimpleNamespace(EnsureDispatch=_unavailable),
+        Dispatch=_unavailable,
+        CastTo=_unavailable,
+    )
+    sys.modules["win32com"] = win32com
+    sys.modules["win32com.client"] = win32com.client
+
+try:
+    import Evtx.Evtx
+except ImportError:
+    evtx = types.ModuleType("Evtx")
+    evtx.Evtx = types.SimpleNamespace(Evtx=None)
+    sys.modules["Evtx"] = evtx
+    sys.modules["Evtx.Evtx"] = evtx.Evtx
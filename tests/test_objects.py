@@ -0,0 +1,240 @@
+import polars as pl
+import pytest
+import pythoncom
+import win32com.client
+from types import SimpleNamespace
+from datetime import datetime, timedelta, timezone
+
+from pytask_scheduler.objects.objects import TaskFolder, TaskScheduler, TasksDataFrame
+
+
+class FakeTask:
+    """Stand-in for the RegisteredTask com object."""
+    def __init__(self, path: str):
+        self.Path = path
+        self.Name = path.rsplit("\\", 1)[-1]
+        self.Enabled = True
+        self.State = 3
+        self.NextRunTime = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        self.LastRunTime = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.LastTaskResult = 0
+        self.NumberOfMissedRuns = 0
+        self.Definition = SimpleNamespace(
+            RegistrationInfo=SimpleNamespace(
+                Author="author",
+                Date="2024-01-01T00:00:00",
+                Description="description",
+                Source=None
+            ),
+            Settings=SimpleNamespace(
+                AllowDemandStart=True,
+                StartWhenAvailable=True,
+                Enabled=True,
+                Hidden=False,
+                RestartInterval="PT1M",
+                RestartCount=3,
+                ExecutionTimeLimit="PT1H",
+                MultipleInstances=0
+            ),
+            Actions=[SimpleNamespace(Type=0, Path=f"C:\\{self.Name}.bat")]
+        )
+
+
+class FakeFolder:
+    """Stand-in for the TaskFolder com object."""
+    def __init__(
+        self,
+        path: str,
+        subfolders: list["FakeFolder"]|None=None,
+        tasks: list[str]|None=None
+    ):
+        self.Path = path
+        self.Name = path.rsplit("\\", 1)[-1] or "\\"
+        self.subfolders = subfolders or []
+        prefix = path.rstrip("\\")
+        self.tasks = [FakeTask(f"{prefix}\\{t}") for t in tasks or []]
+
+    def GetFolders(self, flags: int):
+        return list(self.subfolders)
+
+    def GetTasks(self, flags: int):
+        return list(self.tasks)
+
+    def GetTask(self, path: str):
+        stack = [self]
+        while stack:
+            folder = stack.pop()
+            for t in folder.tasks:
+                if t.Path == path:
+                    return t
+            stack.extend(folder.subfolders)
+        raise KeyError(path)
+
+
+class FakeClient:
+    """Stand-in for the Schedule.Service com object."""
+    def __init__(self, root: FakeFolder):
+        self.folders = {}
+        stack = [root]
+        while stack:
+            folder = stack.pop()
+            self.folders[folder.Path] = folder
+            stack.extend(folder.subfolders)
+
+    def Connect(self):
+        pass
+
+    def GetFolder(self, path: str):
+        return self.folders[path]
+
+
+@pytest.fixture
+def make_scheduler(monkeypatch):
+    """Builds a TaskScheduler connected to a fake client serving the folder tree."""
+    def _make_scheduler(root: FakeFolder) -> TaskScheduler:
+        monkeypatch.setattr(
+            win32com.client.gencache,
+            "EnsureDispatch",
+            lambda prog_id: FakeClient(root)
+        )
+        return TaskScheduler()
+    return _make_scheduler
+
+
+def test_get_folder_resolves_duplicate_names_in_listed_order(make_scheduler):
+    root = FakeFolder("\\", [
+        FakeFolder("\\A", [FakeFolder("\\A\\X")]),
+        FakeFolder("\\B", [FakeFolder("\\B\\X")]),
+    ])
+    ts = make_scheduler(root)
+    assert ts.get_folder("X").folder.Path == "\\A\\X"
+
+
+def test_get_folder_resolves_duplicate_names_depth_first(make_scheduler):
+    root = FakeFolder("\\", [
+        FakeFolder("\\A", [FakeFolder("\\A\\B", [FakeFolder("\\A\\B\\X")])]),
+        FakeFolder("\\X"),
+    ])
+    ts = make_scheduler(root)
+    assert ts.get_folder("X").folder.Path == "\\A\\B\\X"
+
+
+def test_get_folder_unknown_name(make_scheduler):
+    ts = make_scheduler(FakeFolder("\\", [FakeFolder("\\A")]))
+    with pytest.raises(ValueError):
+        ts.get_folder("missing")
+
+
+def make_task_info(next_run_time, last_run_time) -> dict:
+    return {
+        "name":"task",
+        "enabled":True,
+        "task_state":3,
+        "next_run_time":next_run_time,
+        "last_run_time":last_run_time,
+        "last_task_result":0,
+        "number_of_missed_runs":0,
+        "task_path":"\\Folder\\task",
+        "author":"author",
+        "registration_date":"2024-01-01T00:00:00",
+        "task_description":"description",
+        "task_source":None,
+        "AllowDemandStart":True,
+        "StartWhenAvailable":True,
+        "Enabled":True,
+        "Hidden":False,
+        "RestartInterval":"PT1M",
+        "RestartCount":3,
+        "ExecutionTimeLimit":"PT1H",
+        "MultipleInstances":0,
+        "execution_path":"C:\\task.bat"
+    }
+
+
+def test_today_filters_with_timezone_aware_com_dates():
+    # pywin32 returns com dates as local wall clock times with a utc tzinfo attached.
+    now = datetime.now()
+    due = now + timedelta(minutes=1)
+    completed = now - timedelta(minutes=1)
+    records = [
+        make_task_info(due.replace(tzinfo=timezone.utc), completed.replace(tzinfo=timezone.utc))
+    ]
+
+    tdf = TasksDataFrame.from_records(records)
+    assert tdf.df.schema["next_run_time"].time_zone is None
+    assert tdf.df.schema["last_run_time"].time_zone is None
+
+    expected_due = int(due.date() == now.date())
+    expected_completed = int(completed.date() == now.date())
+    assert tdf.get_tasks_due_today().df.height == expected_due
+    assert tdf.get_tasks_completed_today().df.height == expected_completed
+
+    filtered = TasksDataFrame.from_records(records, filter_expr=TasksDataFrame.due_today_filter())
+    assert filtered.df.height == expected_due
+    filtered = TasksDataFrame.from_records(
+        records,
+        filter_expr=TasksDataFrame.completed_today_filter()
+    )
+    assert filtered.df.height == expected_completed
+
+
+def test_get_all_tasks_extracts_tasks_on_worker_connections(make_scheduler, monkeypatch):
+    root = FakeFolder("\\", [
+        FakeFolder("\\A", [FakeFolder("\\A\\B", tasks=["b1"])], tasks=["a1", "a2"]),
+        FakeFolder("\\C", tasks=["c1"]),
+    ], tasks=["root1"])
+    ts = make_scheduler(root)
+
+    com_calls = []
+    monkeypatch.setattr(pythoncom, "CoInitialize", lambda: com_calls.append("init"))
+    monkeypatch.setattr(pythoncom, "CoUninitialize", lambda: com_calls.append("uninit"))
+    monkeypatch.setattr(win32com.client, "Dispatch", lambda prog_id: ts.client)
+    monkeypatch.setattr(win32com.client, "CastTo", lambda obj, interface: obj)
+
+    tdf = ts.get_all_tasks()
+    assert tdf.df["task_path"].to_list() == [
+        "\\root1",
+        "\\A\\a1",
+        "\\A\\a2",
+        "\\A\\B\\b1",
+        "\\C\\c1",
+    ]
+    assert tdf.df["execution_path"].to_list()[0] == "C:\\root1.bat"
+    assert com_calls.count("init") == com_calls.count("uninit") > 0
+
+
+def test_unmapped_task_result_keeps_raw_code():
+    records = [make_task_info(datetime(2024, 1, 2), datetime(2024, 1, 1))]
+    records[0]["last_task_result"] = -2147024894
+    tdf = TasksDataFrame.from_records(records)
+    assert tdf.df["last_task_result_definition"].cast(str).to_list() == ["-2147024894"]
+    assert tdf.df["task_state_definition"].cast(str).to_list() == ["READY"]
+
+
+def test_stats_counts_are_int64():
+    records = [make_task_info(datetime(2024, 1, 2), datetime(2024, 1, 1)) for _ in range(2)]
+    records[1]["task_state"] = 1
+    stats = TasksDataFrame.from_records(records).stats()
+    assert all(dtype == pl.Int64 for dtype in stats.schema.values())
+    assert stats.row(0, named=True) == {
+        "task_total":2,
+        "missed_runs_total":0,
+        "unknown_state_total":0,
+        "disabled_state_total":1,
+        "queued_state_total":0,
+        "ready_state_total":1,
+        "running_state_total":0
+    }
+
+
+def test_register_new_task_refreshes_cached_tasks():
+    folder = FakeFolder("\\A", tasks=["a1"])
+
+    def register_task_definition(task_name, *args):
+        folder.tasks.append(FakeTask(f"\\A\\{task_name}"))
+    folder.RegisterTaskDefinition = register_task_definition
+
+    task_folder = TaskFolder(folder)
+    assert task_folder.tasks == ["a1"]
+    task_folder.register_new_task("a2", None)
+    assert task_folder.tasks == ["a1", "a2"]